@@ -1,11 +1,87 @@
-import React, { useState } from 'react';
+import React, { useState, lazy, Suspense } from 'react';
 import StartPage from './pages/StartPage';
 import ConfigPage from './pages/ConfigPage';
-import PreparePage from './pages/PreparePage';
-import InterviewPage from './pages/InterviewPage';
-import ResultPage from './pages/ResultPage';
 import './App.css';
 
+// Pages after the start page (and the LangChain client they pull in) are split out of the main bundle.
+// webpackPrefetch lets the browser fetch them while the user is still on the start page.
+const PreparePage = lazy(() => import(/* webpackPrefetch: true */ './pages/PreparePage'));
+const InterviewPage = lazy(() => import(/* webpackPrefetch: true */ './pages/InterviewPage'));
+const ResultPage = lazy(() => import(/* webpackPrefetch: true */ './pages/ResultPage'));
+
+// Shown while a page chunk is loading
+const PageLoading = () => (
+  <div className="max-w-4xl w-full bg-white rounded-2xl shadow-xl overflow-hidden">
+    <div className="p-8 flex flex-col items-center justify-center h-96">
+      <div className="animate-spin rounded-full h-16 w-16 border-t-2 border-b-2 border-blue-500 mb-4"></div>
+      <p className="text-gray-600">页面加载中，请稍候...</p>
+    </div>
+  </div>
+);
+
+// webpack names failed chunk fetches ChunkLoadError; other bundlers/browsers only report it in the message
+const isChunkLoadError = (error) =>
+  error?.name === 'ChunkLoadError' ||
+  /Loading (CSS )?chunk [\w-]+ failed|Failed to fetch dynamically imported module/i.test(error?.message || '');
+
+// A page chunk can fail to load (flaky network, or old chunk names after a redeploy).
+// Only that case offers a reload to fetch the current build; other page errors go back to the start page
+// so the rest of the app state is kept.
+export class PageErrorBoundary extends React.Component {
+  constructor(props) {
+    super(props);
+    this.state = { error: null };
+  }
+
+  static getDerivedStateFromError(error) {
+    return { error };
+  }
+
+  componentDidCatch(error) {
+    console.error('Error rendering page:', error);
+  }
+
+  handleBackToStart = () => {
+    this.setState({ error: null });
+    this.props.onBackToStart();
+  };
+
+  render() {
+    const { error } = this.state;
+    if (!error) {
+      return this.props.children;
+    }
+
+    const chunkLoadFailed = isChunkLoadError(error);
+    return (
+      <div className="max-w-4xl w-full bg-white rounded-2xl shadow-xl overflow-hidden">
+        <div className="p-8 flex flex-col items-center justify-center h-96">
+          <p className="text-gray-600 mb-6 text-center">
+            {chunkLoadFailed
+              ? '页面加载失败，可能是网络异常或系统已更新，请重新加载页面'
+              : '页面出现错误，请返回主页后重试'}
+          </p>
+          {chunkLoadFailed ? (
+            <button
+              onClick={() => window.location.reload()}
+              className="px-6 py-3 bg-blue-600 text-white rounded-lg hover:bg-blue-700 transition-colors font-medium"
+            >
+              重新加载
+            </button>
+          ) : (
+            <button
+              onClick={this.handleBackToStart}
+              className="px-6 py-3 bg-blue-600 text-white rounded-lg hover:bg-blue-700 transition-colors font-medium"
+            >
+              返回主页
+            </button>
+          )}
+        </div>
+      </div>
+    );
+  }
+}
+
 function App() {
   const [showConfig, setShowConfig] = useState(false);
   const [currentPage, setCurrentPage] = useState('start'); // 'start', 'prepare', 'interview', 'result'
@@ -31,8 +107,6 @@ function App() {
       ...config,
       ...newConfig.interviewConfig
     });
-    console.log('Interview Config:', newConfig.interviewConfig);
-    console.log('Model Config:', newConfig.modelConfig);
   };
 
   const startInterview = (mode) => {
@@ -87,33 +161,37 @@ function App() {
         <StartPage onStartInterview={startInterview} />
       )}
       
-      {currentPage === 'prepare' && (
-        <PreparePage 
-          mode={interviewMode} 
-          config={config} 
-          onBack={handleBackToStart} 
-          onStartInterview={handleStartInterview}
-        />
-      )}
+      <PageErrorBoundary onBackToStart={handleBackToStart}>
+        <Suspense fallback={<PageLoading />}>
+          {currentPage === 'prepare' && (
+            <PreparePage 
+              mode={interviewMode} 
+              config={config} 
+              onBack={handleBackToStart} 
+              onStartInterview={handleStartInterview}
+            />
+          )}
 
-      {currentPage === 'interview' && (
-        <InterviewPage
-          mode={interviewMode}
-          config={config}
-          draftNotes={draftNotes}
-          questions={questions}
-          onBack={handleBackToStart}
-          onFinishInterview={handleFinishInterview}
-        />
-      )}
+          {currentPage === 'interview' && (
+            <InterviewPage
+              mode={interviewMode}
+              config={config}
+              draftNotes={draftNotes}
+              questions={questions}
+              onBack={handleBackToStart}
+              onFinishInterview={handleFinishInterview}
+            />
+          )}
 
-      {currentPage === 'result' && (
-        <ResultPage
-          questions={questions}
-          answer={answer}
-          onBackToStart={handleBackToStart}
-        />
-      )}
+          {currentPage === 'result' && (
+            <ResultPage
+              questions={questions}
+              answer={answer}
+              onBackToStart={handleBackToStart}
+            />
+          )}
+        </Suspense>
+      </PageErrorBoundary>
     </div>
   );
 }
@@ -1,8 +1,52 @@
-import { render, screen } from '@testing-library/react';
-import App from './App';
+import { render, screen, fireEvent } from '@testing-library/react';
+import App, { PageErrorBoundary } from './App';
 
-test('renders learn react link', () => {
+// Simulate a page chunk that can't be fetched (e.g. removed by a redeploy):
+// the dynamic import of PreparePage rejects with webpack's ChunkLoadError.
+jest.mock('./pages/PreparePage', () => {
+  const error = new Error('Loading chunk 123 failed.');
+  error.name = 'ChunkLoadError';
+  throw error;
+});
+
+beforeEach(() => {
+  jest.spyOn(console, 'error').mockImplementation(() => {});
+});
+
+afterEach(() => {
+  console.error.mockRestore();
+});
+
+test('renders the start page', () => {
   render(<App />);
-  const linkElement = screen.getByText(/learn react/i);
-  expect(linkElement).toBeInTheDocument();
+  expect(screen.getByText('公务员结构化面试系统')).toBeInTheDocument();
+  expect(screen.getByText('全真模拟')).toBeInTheDocument();
+  expect(screen.getByText('练习模式')).toBeInTheDocument();
+});
+
+test('offers a reload when a page chunk fails to load', async () => {
+  render(<App />);
+  fireEvent.click(screen.getByText('练习模式'));
+
+  expect(await screen.findByText(/页面加载失败/)).toBeInTheDocument();
+  expect(screen.getByText('重新加载')).toBeInTheDocument();
+});
+
+test('shows a generic error for page bugs and returns to the start page', () => {
+  const BrokenPage = () => {
+    throw new TypeError("Cannot read properties of undefined (reading 'map')");
+  };
+  const onBackToStart = jest.fn();
+
+  render(
+    <PageErrorBoundary onBackToStart={onBackToStart}>
+      <BrokenPage />
+    </PageErrorBoundary>
+  );
+
+  expect(screen.getByText('页面出现错误，请返回主页后重试')).toBeInTheDocument();
+  expect(screen.queryByText('重新加载')).not.toBeInTheDocument();
+
+  fireEvent.click(screen.getByText('返回主页'));
+  expect(onBackToStart).toHaveBeenCalledTimes(1);
 });
@@ -1,5 +1,15 @@
 import React, { useState, useRef, useEffect } from 'react';
 
+// Map getUserMedia error names to user-facing messages
+const MIC_ERROR_MESSAGES = {
+  NotFoundError: '未找到可用的麦克风设备，请检查设备连接或系统设置',
+  OverconstrainedError: '未找到可用的麦克风设备，请检查设备连接或系统设置',
+  NotAllowedError: '麦克风权限被拒绝，请确保已授予麦克风权限并刷新页面重试',
+  PermissionDeniedError: '麦克风权限被拒绝，请确保已授予麦克风权限并刷新页面重试',
+  NotReadableError: '麦克风设备正被其他应用占用，请关闭其他应用后重试',
+  AbortError: '设备访问被中断，请重试'
+};
+
 const InterviewPage = ({ mode, config, draftNotes, questions, onBack, onFinishInterview }) => {
   // Ensure questions is always an array
   const safeQuestions = Array.isArray(questions) ? questions : [];
@@ -77,20 +87,8 @@ const InterviewPage = ({ mode, config, draftNotes, questions, onBack, onFinishIn
     } catch (error) {
       console.error('Error accessing microphone:', error);
       
-      let errorMessage = '无法访问麦克风，请检查权限设置';
-      
       // Handle specific error types
-      if (error.name === 'NotFoundError' || error.name === 'OverconstrainedError') {
-        errorMessage = '未找到可用的麦克风设备，请检查设备连接或系统设置';
-      } else if (error.name === 'NotAllowedError' || error.name === 'PermissionDeniedError') {
-        errorMessage = '麦克风权限被拒绝，请确保已授予麦克风权限并刷新页面重试';
-      } else if (error.name === 'NotReadableError') {
-        errorMessage = '麦克风设备正被其他应用占用，请关闭其他应用后重试';
-      } else if (error.name === 'AbortError') {
-        errorMessage = '设备访问被中断，请重试';
-      } else if (error.message) {
-        errorMessage = error.message;
-      }
+      const errorMessage = MIC_ERROR_MESSAGES[error.name] || error.message || '无法访问麦克风，请检查权限设置';
       
       setSpeechError(errorMessage);
     }
@@ -214,8 +212,6 @@ const InterviewPage = ({ mode, config, draftNotes, questions, onBack, onFinishIn
     }
     
     // In a real app, you would upload the transcript to a server here
-    console.log('Interview transcript:', transcript);
-    // Upload logic would go here
     
     if (onFinishInterview) {
       onFinishInterview(transcript);
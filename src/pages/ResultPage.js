@@ -1,6 +1,5 @@
 import React, { useState, useEffect, useRef } from 'react';
 import { evaluateCandidateAnswers } from '../services/openaiService';
-import html2canvas from 'html2canvas';
 import ShareModal from './ShareModal';
 
 const ResultPage = ({ questions, answer, onBackToStart }) => {
@@ -13,7 +12,6 @@ const ResultPage = ({ questions, answer, onBackToStart }) => {
   const [showScreenshot, setShowScreenshot] = useState(false);
   const [screenshot, setScreenshot] = useState(null);
   const [toast, setToast] = useState({ show: false, message: '', type: 'error' }); // 添加 toast 状态
-  const resultRef = useRef();
   const screenshotRef = useRef(); // 新增用于截图的ref
 
   // 显示 toast 通知的函数
@@ -52,6 +50,8 @@ const ResultPage = ({ questions, answer, onBackToStart }) => {
     if (!screenshotRef.current) return;
     
     try {
+      // html2canvas is only needed for sharing, so load it on demand instead of in the main bundle
+      const { default: html2canvas } = await import('html2canvas');
       const canvas = await html2canvas(screenshotRef.current, {
         useCORS: true,
         allowTaint: true,
@@ -128,7 +128,7 @@ const ResultPage = ({ questions, answer, onBackToStart }) => {
             </button>
           </div>
         ) : (
-          <div ref={resultRef}>
+          <div>
             {/* 截图区域开始 */}
             <div ref={screenshotRef}>
               {/* 总体评分 */}
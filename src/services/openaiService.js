@@ -1,12 +1,22 @@
 // src/services/openaiService.js
 import { ChatOpenAI } from "@langchain/openai";
+import { HumanMessage, SystemMessage } from "@langchain/core/messages";
 
-const cleanModelResponse = (content) => {
-  if (typeof content === 'string' && content.startsWith('```json') && content.endsWith('```')) {
-    content = content.slice(7, -3).trim();
+// Extract the JSON payload from a model response.
+// Models sometimes wrap the JSON in a Markdown fence or add prose around it,
+// so take everything between the first opening and the last closing bracket.
+export const cleanModelResponse = (content) => {
+  if (typeof content !== 'string') {
+    return content;
   }
 
-  return content;
+  const start = content.search(/[[{]/);
+  const end = Math.max(content.lastIndexOf(']'), content.lastIndexOf('}'));
+  if (start !== -1 && end > start) {
+    return content.slice(start, end + 1);
+  }
+
+  return content.trim();
 }
 /**
  * Service to interact with OpenAI compatible models via LangChain
@@ -30,6 +40,20 @@ export const getModelConfig = () => {
   return null;
 };
 
+// The model instance is reused across calls until the saved model config changes,
+// so the underlying client isn't rebuilt for every request.
+let cachedModel = null;
+let cachedModelConfig = null;
+
+const getOpenAIModel = () => {
+  const savedModelConfig = localStorage.getItem('modelConfig');
+  if (!cachedModel || savedModelConfig !== cachedModelConfig) {
+    cachedModel = initializeOpenAIModel();
+    cachedModelConfig = savedModelConfig;
+  }
+  return cachedModel;
+};
+
 // Initialize OpenAI compatible model
 // Note: Supports various OpenAI-compatible APIs including DeepSeek
 const initializeOpenAIModel = () => {
@@ -57,6 +81,52 @@ const initializeOpenAIModel = () => {
   return model;
 };
 
+// Map difficulty levels to descriptive text
+const DIFFICULTY_MAP = {
+  easy: '较为简单，适合初学者',
+  medium: '中等难度，有一定挑战性',
+  hard: '较难，需要深入思考和丰富经验'
+};
+
+// Map question length to descriptive text
+const LENGTH_MAP = {
+  short: '简短精练（约20-30字）',
+  medium: '中等长度（约30-50字）',
+  long: '较长详细（约50-80字）'
+};
+
+// Static instructions for question generation, built once as a SystemMessage.
+// Keeping them identical across calls and ahead of the per-call parameters lets providers
+// with prefix caching (e.g. DeepSeek context caching) reuse them instead of reprocessing every time.
+const QUESTION_SYSTEM_MESSAGE = new SystemMessage(`# Role
+你是一位中国公务员结构化面试的命题专家，熟悉国考、省考及事业单位面试的题型规律。你擅长设计考察考生综合素质、应变能力和政治素养的高质量面试题。
+
+# Task
+请根据用户指定的【题型】、【难度】和【数量】，生成相应数量的面试题目。
+
+# Question Types Definition (题型定义)
+1. **综合分析**: 考察社会现象、政策理解、名言警句等。要求题目具有辩证性，能引发深层思考。
+2. **计划组织**: 考察活动策划、调研、会议组织等。要求场景具体，有明确的任务目标和限制条件。
+3. **人际关系**: 考察与领导、同事、群众的沟通协调。要求设定具体的矛盾冲突点（如误解、利益冲突）。
+4. **应急应变**: 考察突发事件处理。要求情境紧迫，压力感强（如群众闹事、设备故障、时间冲突）。
+5. **岗位匹配**: 考察求职动机、职业规划与岗位认知的匹配度。
+
+# Constraints
+1. **真实感**: 题目必须贴近实际公务员工作场景，避免过于科幻或脱离实际。
+2. **多样性**: 如果生成多道题，请确保题材不重复（例如不要两道题都是关于环保的）。
+3. **JSON Format**: 必须严格输出标准的 JSON 格式，不要包含 Markdown 标记。
+4. **数量要求**: 必须严格按照用户指定的数量生成题目，不多不少。
+
+# Output JSON Structure
+[
+  {
+    "id": 1, // 序号
+    "type": "综合分析", // 题型
+    "text": "题目具体内容...", // 题目文本，长度适中（20-50字）
+    "analysis_points": ["点1", "点2"] // (可选) 给后端的简单提示，用于辅助评分（不展示给考生）
+  }
+]`);
+
 /**
  * Generate a single interview question using OpenAI compatible model
  * @param {number} questionCount - The number of questions to generate
@@ -67,58 +137,19 @@ const initializeOpenAIModel = () => {
  */
 export const generateInterviewQuestions = async (questionCount, options = {}) => {
   try {
-    const model = initializeOpenAIModel();
+    const model = getOpenAIModel();
 
     // Extract options with defaults
     const { difficulty = 'medium', questionLength = 'medium' } = options;
 
-    // Map difficulty levels to descriptive text
-    const difficultyMap = {
-      easy: '较为简单，适合初学者',
-      medium: '中等难度，有一定挑战性',
-      hard: '较难，需要深入思考和丰富经验'
-    };
-
-    // Map question length to descriptive text
-    const lengthMap = {
-      short: '简短精练（约20-30字）',
-      medium: '中等长度（约30-50字）',
-      long: '较长详细（约50-80字）'
-    };
-
-    const prompt = `# Role
-    你是一位中国公务员结构化面试的命题专家，熟悉国考、省考及事业单位面试的题型规律。你擅长设计考察考生综合素质、应变能力和政治素养的高质量面试题。
-
-    # Task
-    请根据用户指定的【题型】、【难度】和【数量】，生成相应数量的面试题目。
-    用户指定了需要生成 ${questionCount} 道题目。
-    题目难度: ${difficulty} - ${difficultyMap[difficulty]}
-    题目长度: ${questionLength} - ${lengthMap[questionLength]}
-
-    # Question Types Definition (题型定义)
-    1. **综合分析**: 考察社会现象、政策理解、名言警句等。要求题目具有辩证性，能引发深层思考。
-    2. **计划组织**: 考察活动策划、调研、会议组织等。要求场景具体，有明确的任务目标和限制条件。
-    3. **人际关系**: 考察与领导、同事、群众的沟通协调。要求设定具体的矛盾冲突点（如误解、利益冲突）。
-    4. **应急应变**: 考察突发事件处理。要求情境紧迫，压力感强（如群众闹事、设备故障、时间冲突）。
-    5. **岗位匹配**: 考察求职动机、职业规划与岗位认知的匹配度。
-
-    # Constraints
-    1. **真实感**: 题目必须贴近实际公务员工作场景，避免过于科幻或脱离实际。
-    2. **多样性**: 如果生成多道题，请确保题材不重复（例如不要两道题都是关于环保的）。
-    3. **JSON Format**: 必须严格输出标准的 JSON 格式，不要包含 Markdown 标记。
-    4. **数量要求**: 必须生成 exactly ${questionCount} 道题目，不多不少。
-
-    # Output JSON Structure
-    [
-      {
-        "id": 1, // 序号
-        "type": "综合分析", // 题型
-        "text": "题目具体内容...", // 题目文本，长度适中（20-50字）
-        "analysis_points": ["点1", "点2"] // (可选) 给后端的简单提示，用于辅助评分（不展示给考生）
-      }
-    ]`;
-
-    const response = await model.invoke(prompt);
+    // Only the task parameters vary between calls, so they go after the static system prompt
+    const prompt = `# Requirements
+请根据以上要求生成面试题目。
+题目数量: ${questionCount} 道（必须生成 exactly ${questionCount} 道题目，不多不少）
+题目难度: ${difficulty} - ${DIFFICULTY_MAP[difficulty]}
+题目长度: ${questionLength} - ${LENGTH_MAP[questionLength]}`;
+
+    const response = await model.invoke([QUESTION_SYSTEM_MESSAGE, new HumanMessage(prompt)]);
 
     // Try to parse the response content as JSON
     try {
@@ -136,56 +167,114 @@ export const generateInterviewQuestions = async (questionCount, options = {}) =>
   }
 };
 
+// Static instructions for answer evaluation; the questions and answer follow as the user message
+const EVALUATION_SYSTEM_MESSAGE = new SystemMessage(`# Role
+你是一位专业的公务员面试考官，具有丰富的面试评分经验。你的任务是对考生的所有面试回答进行整体专业评分和详细点评。
+
+# Scoring Criteria (评分标准)
+1. **观点明确** (20分): 回答是否有明确的观点和立场
+2. **逻辑清晰** (20分): 回答是否条理清晰，逻辑性强
+3. **内容充实** (20分): 是否有充分的事实、例子或理论支撑
+4. **政策理解** (20分): 对相关政策的理解和应用能力
+5. **语言表达** (20分): 语言是否流畅、准确、得体
+
+# Constraints
+1. **JSON Format**: 必须严格输出标准的 JSON 格式，不要包含 Markdown 标记。
+
+# Output JSON Structure
+
+{
+  "overallScore": 85, // 总分 (0-100)
+  "feedback": "整体表现良好，观点明确，逻辑清晰。但在政策理解方面还可以进一步加强...",
+  "strengths": ["观点明确", "逻辑性强"], // 优点列表
+  "improvements": ["加强政策理解", "增加实例支撑"], // 改进建议
+  "questionEvaluations": [  // 各题简要评价
+    {
+      "questionId": 1,
+      "score": 80,
+      "briefFeedback": "回答较为全面，但可以增加一些实际案例..."
+    }
+  ]
+}`);
+
+// generateInterviewQuestions falls back to the model's raw text when it can't
+// parse the question list, so treat that text as a single question.
+const normalizeQuestions = (questions) => {
+  if (Array.isArray(questions)) {
+    return questions;
+  }
+  if (typeof questions === 'string' && questions.trim()) {
+    return [{ id: 1, type: '综合', text: questions.trim() }];
+  }
+  return [];
+};
+
+// Evaluation returned when the candidate gave no answer at all
+const buildEmptyAnswerEvaluation = (questions) => ({
+  overallScore: 0,
+  feedback: '未检测到有效回答，无法进行评分。请确认麦克风可用并完整作答后重试。',
+  strengths: [],
+  improvements: ['完整作答每一道题目'],
+  questionEvaluations: questions.map((q, i) => ({
+    questionId: q.id ?? i + 1,
+    score: 0,
+    briefFeedback: '未作答'
+  }))
+});
+
+// Cache of evaluation results keyed by model config + questions + answer.
+// Stores the pending promise so concurrent calls with the same input share one request.
+// Eviction is oldest-first (FIFO); a cache hit does not refresh an entry's position.
+export const EVALUATION_CACHE_SIZE = 20;
+const evaluationCache = new Map();
+
 /**
  * Evaluate candidate answers using OpenAI compatible model with overall scoring
- * @param {Array} questions - Array of questions with their details
+ * Identical inputs reuse the cached result instead of calling the model again.
+ * @param {Array|String} rawQuestions - Array of questions with their details, or the raw-text fallback
  * @param {String} answer - Array of candidate answers
  * @returns {Promise<Object>} - Overall evaluation result
  */
-export const evaluateCandidateAnswers = async (questions, answer) => {
-  try {
-    const model = initializeOpenAIModel();
+export const evaluateCandidateAnswers = (rawQuestions, answer) => {
+  const questions = normalizeQuestions(rawQuestions);
+
+  // Nothing to grade without an answer, so skip the model round-trip
+  if (typeof answer !== 'string' || !answer.trim()) {
+    return Promise.resolve(buildEmptyAnswerEvaluation(questions));
+  }
 
-    const prompt = `# Role
-    你是一位专业的公务员面试考官，具有丰富的面试评分经验。你的任务是对考生的所有面试回答进行整体专业评分和详细点评。
+  const cacheKey = JSON.stringify([localStorage.getItem('modelConfig'), questions, answer]);
+  if (evaluationCache.has(cacheKey)) {
+    return evaluationCache.get(cacheKey);
+  }
 
-    # Scoring Criteria (评分标准)
-    1. **观点明确** (20分): 回答是否有明确的观点和立场
-    2. **逻辑清晰** (20分): 回答是否条理清晰，逻辑性强
-    3. **内容充实** (20分): 是否有充分的事实、例子或理论支撑
-    4. **政策理解** (20分): 对相关政策的理解和应用能力
-    5. **语言表达** (20分): 语言是否流畅、准确、得体
+  const pending = requestEvaluation(questions, answer).catch((error) => {
+    // Don't cache failures so that retrying actually hits the model again
+    evaluationCache.delete(cacheKey);
+    throw error;
+  });
 
-    # Input Data
-    请根据以下题目和考生回答进行整体评分：
-    
-    ${questions.map((q, i) => `
-    题目${i + 1} (${q.type}题):
-    ${q.text}
-    
-    考生回答:
-    ${answer}`)}
+  evaluationCache.set(cacheKey, pending);
+  if (evaluationCache.size > EVALUATION_CACHE_SIZE) {
+    evaluationCache.delete(evaluationCache.keys().next().value);
+  }
 
-    # Constraints
-    1. **JSON Format**: 必须严格输出标准的 JSON 格式，不要包含 Markdown 标记。
+  return pending;
+};
 
-    # Output JSON Structure
+const requestEvaluation = async (questions, answer) => {
+  try {
+    const model = getOpenAIModel();
 
-    {
-      "overallScore": 85, // 总分 (0-100)
-      "feedback": "整体表现良好，观点明确，逻辑清晰。但在政策理解方面还可以进一步加强...",
-      "strengths": ["观点明确", "逻辑性强"], // 优点列表
-      "improvements": ["加强政策理解", "增加实例支撑"], // 改进建议
-      "questionEvaluations": [  // 各题简要评价
-        {
-          "questionId": 1,
-          "score": 80,
-          "briefFeedback": "回答较为全面，但可以增加一些实际案例..."
-        }
-      ]
-    }`;
-
-    const response = await model.invoke(prompt);
+    const prompt = `# Input Data
+请根据以下题目和考生回答进行整体评分：
+
+${questions.map((q, i) => `题目${i + 1} (${q.type}题): ${q.text}`).join('\n')}
+
+考生回答:
+${answer}`;
+
+    const response = await model.invoke([EVALUATION_SYSTEM_MESSAGE, new HumanMessage(prompt)]);
 
     // Try to parse the response content as JSON
     try {
@@ -0,0 +1,170 @@
+const mockInvoke = jest.fn();
+
+jest.mock('@langchain/openai', () => ({
+  ChatOpenAI: jest.fn(() => ({ invoke: mockInvoke })),
+}));
+
+// Jest 27 (react-scripts 5) ignores package.json "exports", so the
+// @langchain/core/messages subpath can't be resolved from node_modules.
+// Mock it virtually with plain message classes that keep their content.
+jest.mock(
+  '@langchain/core/messages',
+  () => {
+    class MockMessage {
+      constructor(content) {
+        this.content = content;
+      }
+    }
+    return {
+      SystemMessage: class SystemMessage extends MockMessage {},
+      HumanMessage: class HumanMessage extends MockMessage {},
+    };
+  },
+  { virtual: true }
+);
+
+const questions = [
+  { id: 1, type: '综合分析', text: '谈谈你对基层治理的理解' },
+  { id: 2, type: '应急应变', text: '群众聚集在办事大厅，你怎么处理' },
+];
+
+const evaluation = {
+  overallScore: 80,
+  feedback: '整体表现良好',
+  strengths: ['观点明确'],
+  improvements: ['增加实例支撑'],
+  questionEvaluations: [],
+};
+
+let service;
+
+beforeEach(() => {
+  // Reload the module so every test starts with an empty evaluation cache
+  jest.resetModules();
+  localStorage.clear();
+  mockInvoke.mockReset();
+  mockInvoke.mockResolvedValue({ content: JSON.stringify(evaluation) });
+  service = require('./openaiService');
+});
+
+describe('cleanModelResponse', () => {
+  test('returns plain JSON unchanged', () => {
+    expect(service.cleanModelResponse('[{"id":1}]')).toBe('[{"id":1}]');
+  });
+
+  test('strips a json code fence', () => {
+    expect(service.cleanModelResponse('```json\n{"a":1}\n```')).toBe('{"a":1}');
+  });
+
+  test('strips a bare code fence', () => {
+    expect(service.cleanModelResponse('```\n[1,2]\n```')).toBe('[1,2]');
+  });
+
+  test('strips leading and trailing prose', () => {
+    expect(service.cleanModelResponse('好的，结果如下：{"a":[1]} 希望对你有帮助')).toBe('{"a":[1]}');
+  });
+
+  test('returns non-string input as is', () => {
+    const content = [{ type: 'text', text: '{}' }];
+    expect(service.cleanModelResponse(content)).toBe(content);
+  });
+
+  test('trims text without any brackets', () => {
+    expect(service.cleanModelResponse('  无法生成  ')).toBe('无法生成');
+  });
+});
+
+describe('evaluateCandidateAnswers cache', () => {
+  test('identical concurrent calls share a single request', async () => {
+    const [first, second] = await Promise.all([
+      service.evaluateCandidateAnswers(questions, '我的回答'),
+      service.evaluateCandidateAnswers(questions, '我的回答'),
+    ]);
+
+    expect(mockInvoke).toHaveBeenCalledTimes(1);
+    expect(first).toEqual(evaluation);
+    expect(second).toEqual(evaluation);
+  });
+
+  test('a rejected call is evicted so a retry calls the model again', async () => {
+    mockInvoke.mockRejectedValueOnce(new Error('network error'));
+
+    await expect(service.evaluateCandidateAnswers(questions, '我的回答')).rejects.toThrow('network error');
+    await expect(service.evaluateCandidateAnswers(questions, '我的回答')).resolves.toEqual(evaluation);
+
+    expect(mockInvoke).toHaveBeenCalledTimes(2);
+  });
+
+  test('changing the model config misses the cache', async () => {
+    localStorage.setItem('modelConfig', JSON.stringify({ modelName: 'deepseek-chat' }));
+    await service.evaluateCandidateAnswers(questions, '我的回答');
+
+    localStorage.setItem('modelConfig', JSON.stringify({ modelName: 'deepseek-reasoner' }));
+    await service.evaluateCandidateAnswers(questions, '我的回答');
+
+    expect(mockInvoke).toHaveBeenCalledTimes(2);
+  });
+
+  test('keeps at most EVALUATION_CACHE_SIZE entries, evicting the oldest first', async () => {
+    const size = service.EVALUATION_CACHE_SIZE;
+    for (let i = 0; i <= size; i++) {
+      await service.evaluateCandidateAnswers(questions, `回答 ${i}`);
+    }
+    expect(mockInvoke).toHaveBeenCalledTimes(size + 1);
+
+    // The newest `size` entries are still cached
+    for (let i = 1; i <= size; i++) {
+      await service.evaluateCandidateAnswers(questions, `回答 ${i}`);
+    }
+    expect(mockInvoke).toHaveBeenCalledTimes(size + 1);
+
+    // The oldest entry was evicted when the limit was exceeded
+    await service.evaluateCandidateAnswers(questions, '回答 0');
+    expect(mockInvoke).toHaveBeenCalledTimes(size + 2);
+  });
+});
+
+describe('evaluateCandidateAnswers with a blank answer', () => {
+  test.each(['', '   '])('returns a zero score without calling the model for %j', async (answer) => {
+    const result = await service.evaluateCandidateAnswers(questions, answer);
+
+    expect(mockInvoke).not.toHaveBeenCalled();
+    expect(result).toEqual({
+      overallScore: 0,
+      feedback: expect.any(String),
+      strengths: [],
+      improvements: expect.any(Array),
+      questionEvaluations: [
+        { questionId: 1, score: 0, briefFeedback: expect.any(String) },
+        { questionId: 2, score: 0, briefFeedback: expect.any(String) },
+      ],
+    });
+  });
+
+  test('treats raw-text questions as a single question', async () => {
+    const result = await service.evaluateCandidateAnswers('模型返回的原始文本', '');
+
+    expect(mockInvoke).not.toHaveBeenCalled();
+    expect(result.questionEvaluations).toEqual([
+      { questionId: 1, score: 0, briefFeedback: expect.any(String) },
+    ]);
+  });
+
+  test('tolerates missing questions', async () => {
+    const result = await service.evaluateCandidateAnswers(undefined, '');
+
+    expect(result.questionEvaluations).toEqual([]);
+  });
+});
+
+describe('evaluateCandidateAnswers with raw-text questions', () => {
+  test('sends the text to the model as a single question', async () => {
+    const result = await service.evaluateCandidateAnswers('模型返回的原始文本', '我的回答');
+
+    expect(result).toEqual(evaluation);
+    expect(mockInvoke).toHaveBeenCalledTimes(1);
+    const prompt = mockInvoke.mock.calls[0][0].map((message) => message.content).join('\n');
+    expect(prompt).toContain('模型返回的原始文本');
+    expect(prompt).toContain('我的回答');
+  });
+});